@@ -9,17 +9,70 @@ and compares it with the deployed version information from StackGen environments
 import argparse
 import json
 import os
-import re
 import sys
-from typing import Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple, Union
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from fetch_version import fetch_version_content, Environment
 from service_mapping import ServiceMapper
 
+try:
+    # orjson (Rust) decodes JSON 2-5x faster than the stdlib; fall back
+    # silently when it isn't installed.
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Module-level session shared by all GitHub API calls so sequential fetches
+# reuse one keepalive TLS connection to api.github.com.
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(max_retries=Retry(
+    total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504)
+)))
+
+
+# Version-bearing keys that don't follow the *_VERSION / *_TAG / IMAGE_*
+# naming conventions but should still be picked up from .env files.
+# Bytes because the parser works on the undecoded payload.
+_SPECIAL_ENV_KEYS = frozenset({
+    b'sgai_orchestration', b'stackgen_notifications', b'appcd_analyzer',
+    b'sgai_knowledge', b'sgai_control'
+})
+
+
+# On-disk ETag cache for GitHub content fetches. A 304 Not Modified response
+# carries no body and does not count against the primary rate limit, so repeat
+# fetches of an unchanged .env file are effectively free.
+_ETAG_CACHE_FILE = os.path.join(
+    os.path.expanduser('~'), '.cache', 'release-utils', 'gh_etags.json'
+)
+
+
+def _load_etag_cache() -> Dict[str, Dict[str, str]]:
+    """Load the ETag cache index, returning an empty dict if unavailable."""
+    try:
+        with open(_ETAG_CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _save_etag_cache(cache: Dict[str, Dict[str, str]]) -> None:
+    """Persist the ETag cache index, ignoring filesystem errors."""
+    try:
+        os.makedirs(os.path.dirname(_ETAG_CACHE_FILE), exist_ok=True)
+        with open(_ETAG_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
 
 class GitHubEnvFetcher:
     """Handles fetching .env file content from GitHub repository."""
-    
+
     def __init__(self, token: Optional[str] = None):
         """
         Initialize with GitHub PAT token.
@@ -34,87 +87,135 @@ class GitHubEnvFetcher:
                 "or pass token directly."
             )
         
+        # Raw media type: GitHub returns the file bytes directly, skipping
+        # the JSON envelope and base64 decode entirely.
         self.headers = {
             'Authorization': f'token {self.token}',
-            'Accept': 'application/vnd.github.v3+json'
+            'Accept': 'application/vnd.github.raw+json'
         }
+        # Shared session: Authorization/Accept are set once instead of being
+        # reserialized on every call.
+        self.session = _SESSION
+        self.session.headers.update(self.headers)
     
-    def fetch_env_file(self, repo: str, file_path: str = ".env", branch: str = "main") -> str:
+    def fetch_env_file(self, repo: str, file_path: str = ".env", branch: str = "main") -> bytes:
         """
         Fetch .env file content from GitHub repository.
-        
+
         Args:
             repo: Repository in format 'owner/repo'
             file_path: Path to .env file in repository
             branch: Branch name to fetch from
-            
+
         Returns:
-            Content of the .env file
-            
+            Raw content of the .env file; decoding is left to the consumer
+
         Raises:
             requests.RequestException: If API request fails
         """
         url = f"https://api.github.com/repos/{repo}/contents/{file_path}"
         params = {'ref': branch}
-        
+
+        cache_key = f"{repo}|{file_path}|{branch}"
+        cache = _load_etag_cache()
+        cached = cache.get(cache_key)
+
+        headers = {}
+        if cached and cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+
         try:
             print(f"Fetching {file_path} from {repo} (branch: {branch})")
-            response = requests.get(url, headers=self.headers, params=params, timeout=30)
+            response = self.session.get(url, headers=headers, params=params, timeout=30)
+
+            if response.status_code == 304 and cached:
+                print(f"Using cached content for {file_path} (not modified)")
+                return cached['content'].encode('utf-8')
+
             response.raise_for_status()
-            
-            data = response.json()
-            
-            if data.get('encoding') == 'base64':
-                import base64
-                content = base64.b64decode(data['content']).decode('utf-8')
-                return content
-            else:
-                raise ValueError(f"Unexpected encoding: {data.get('encoding')}")
-                
+
+            # Keep the payload as bytes — env files are ASCII in practice and
+            # the parser works on bytes, so skip the decode pass here.
+            content = response.content
+
+            etag = response.headers.get('ETag')
+            if etag:
+                cache[cache_key] = {
+                    'etag': etag,
+                    'content': content.decode('utf-8', 'replace')
+                }
+                _save_etag_cache(cache)
+
+            return content
+
         except requests.exceptions.RequestException as e:
             raise requests.RequestException(f"Failed to fetch {file_path} from {repo}: {e}")
 
 
+def _iter_env_pairs(env_content: bytes):
+    """Yield (service_name, version) pairs from raw .env content.
+
+    .env files are overwhelmingly plain KEY=VALUE lines, so dispatch on key
+    prefix/suffix with C-level string methods instead of a regex. This is
+    linear-time by construction — no backtracking engine to blow up on
+    adversarial input.
+    """
+    for raw in env_content.splitlines():
+        line = raw.strip()
+        if not line or line.startswith(b'#'):
+            continue
+
+        key, sep, value = line.partition(b'=')
+        if not sep:
+            continue
+
+        value = value.strip().strip(b'"').strip(b"'")
+        if not value:
+            continue
+        value = value.split()[0]
+
+        key = key.strip().upper()
+        if key.endswith(b'_VERSION'):
+            service_name = key[:-8]
+        elif key.startswith(b'VERSION_'):
+            service_name = key[8:]
+        elif key.endswith(b'_TAG'):
+            service_name = key[:-4]
+        elif key.startswith(b'IMAGE_'):
+            # IMAGE_SERVICE=repo:tag — keep only the tag
+            service_name = key[6:]
+            value = value.rsplit(b':', 1)[-1]
+        elif key.lower() in _SPECIAL_ENV_KEYS:
+            service_name = key
+        else:
+            continue
+
+        yield (service_name.lower().decode('ascii', 'replace'),
+               value.decode('ascii', 'replace'))
+
+
 class VersionComparator:
     """Handles comparison between deployed versions and repository versions."""
     
     @staticmethod
-    def parse_env_content(env_content: str) -> Dict[str, str]:
+    def parse_env_content(env_content: Union[bytes, str]) -> Dict[str, str]:
         """
         Parse .env file content and extract version information.
-        
+
         Args:
-            env_content: Content of .env file
-            
+            env_content: Content of .env file, as raw bytes or text
+
         Returns:
             Dictionary mapping service names to versions
         """
-        versions = {}
-        
-        # Look for VERSION patterns in .env file
-        version_patterns = [
-            r'(\w+)_VERSION\s*=\s*["\']?([^\s"\']+)["\']?',  # SERVICE_VERSION=1.2.3
-            r'VERSION_(\w+)\s*=\s*["\']?([^\s"\']+)["\']?',  # VERSION_SERVICE=1.2.3
-            r'(\w+)_TAG\s*=\s*["\']?([^\s"\']+)["\']?',      # SERVICE_TAG=v1.2.3
-            r'IMAGE_(\w+)\s*=\s*["\']?[^:]+:([^\s"\']+)["\']?',  # IMAGE_SERVICE=repo:tag
-            r'(SGAI_ORCHESTRATION|STACKGEN_NOTIFICATIONS|APPCD_ANALYZER|SGAI_KNOWLEDGE|SGAI_CONTROL)\s*=\s*["\']?([^\s"\']+)["\']?'  # Special cases
-        ]
-        
-        for line in env_content.split('\n'):
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-                
-            for pattern in version_patterns:
-                match = re.match(pattern, line, re.IGNORECASE)
-                if match:
-                    if len(match.groups()) == 2:
-                        service_name = match.group(1).lower()
-                        version = match.group(2).strip()
-                        versions[service_name] = version
-                        break
-        
-        return versions
+        # Work on bytes throughout and decode only the handful of extracted
+        # names/versions at the end, skipping a full UTF-8 pass over the file.
+        if isinstance(env_content, str):
+            env_content = env_content.encode('utf-8', 'surrogateescape')
+
+        # Bulk-construct the dict from a generator so CPython sizes it once
+        # instead of growing it item by item.
+        return dict(_iter_env_pairs(env_content))
     
     @staticmethod
     def parse_version_json(version_content: str) -> Dict[str, str]:
@@ -128,9 +229,14 @@ class VersionComparator:
             Dictionary mapping service names to versions
         """
         try:
-            data = json.loads(version_content)
+            data = _json_loads(version_content)
             versions = {}
-            
+
+            # Fast path: the real version.json is a flat {service: version}
+            # dict, which collapses to a single comprehension.
+            if isinstance(data, dict) and all(isinstance(v, str) for v in data.values()):
+                return {key.lower(): value for key, value in data.items()}
+
             # Handle different possible JSON structures
             if isinstance(data, dict):
                 for key, value in data.items():
@@ -228,7 +334,12 @@ def main():
         action="store_true",
         help="Enable verbose output"
     )
-    
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Skip the local version.json cache and fetch fresh content"
+    )
+
     args = parser.parse_args()
     
     try:
@@ -241,10 +352,9 @@ def main():
         # Get StackGen environment
         if args.stackgen_env:
             # Validate against known environments
-            valid_envs = [env.value for env in Environment]
-            if args.stackgen_env not in valid_envs:
+            if args.stackgen_env not in Environment.VALID:
                 print(f"Warning: '{args.stackgen_env}' is not in the predefined environment list.")
-                print(f"Valid environments: {', '.join(valid_envs)}")
+                print(f"Valid environments: {', '.join(e.value for e in Environment)}")
                 confirm = input("Continue anyway? (y/N): ").strip().lower()
                 if confirm not in ['y', 'yes']:
                     print("Operation cancelled.")
@@ -264,21 +374,30 @@ def main():
         print(f"StackGen Environment: {stackgen_env}")
         print(f"{'='*60}")
         
-        # Fetch .env file content
-        env_content = github_fetcher.fetch_env_file(args.repo, args.env_file, args.branch)
-        
+        # Fetch .env file and deployed version content concurrently — they
+        # hit different hosts and are fully independent, so wall time is
+        # max(T_github, T_stackgen) instead of the sum.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            env_future = executor.submit(
+                github_fetcher.fetch_env_file, args.repo, args.env_file, args.branch
+            )
+            deployed_future = executor.submit(
+                fetch_version_content, stackgen_env, use_cache=not args.no_cache
+            )
+            env_content = env_future.result()
+            deployed_content = deployed_future.result()
+
         if args.verbose:
+            preview = env_content[:500].decode('utf-8', 'replace')
             print(f"\n.env file content preview:")
             print("-" * 40)
-            print(env_content[:500] + ("..." if len(env_content) > 500 else ""))
+            print(preview + ("..." if len(env_content) > 500 else ""))
             print("-" * 40)
-        
-        # Fetch deployed version content
-        deployed_content = fetch_version_content(stackgen_env)
+
         if not deployed_content:
             print("Failed to fetch deployed version information.")
             sys.exit(1)
-        
+
         if args.verbose:
             print(f"\nDeployed version content:")
             print("-" * 40)
@@ -297,59 +416,59 @@ def main():
         # Compare versions
         comparison_results, has_differences = comparator.compare_versions(deployed_versions, repo_versions)
         
-        print(f"\n{'='*60}")
-        print("COMPARISON RESULTS")
-        print(f"{'='*60}")
-        
+        # Build the whole report in memory and emit it with a single write,
+        # instead of one locked stdout write per line.
+        out = [f"\n{'='*60}", "COMPARISON RESULTS", f"{'='*60}"]
+
         if has_differences:
             differences = comparison_results["differences"]
             env_only = comparison_results["env_only"]
             deployed_only = comparison_results["deployed_only"]
             matches = comparison_results["matches"]
-            
+
+            # One preformatted string per record: fields are pulled out once
+            # and interpolated in a single f-string instead of several.
             if differences:
-                print("⚠️  VERSION DIFFERENCES DETECTED:")
-                print()
-                
+                out.append("⚠️  VERSION DIFFERENCES DETECTED:")
+                out.append("")
+
                 for service, data in differences.items():
-                    env_name = data["env_name"] or "N/A"
-                    deployed_name = data["deployed_name"] or "N/A"
-                    env_ver = data["env_version"] or "N/A"
-                    deployed_ver = data["deployed_version"] or "N/A"
-                    
-                    print(f"🔄 {env_name.upper()} → {deployed_name.upper()}:")
-                    print(f"   Repository (.env): {env_ver}")
-                    print(f"   Deployed: {deployed_ver}")
-                    print()
-            
+                    en = data["env_name"] or "N/A"
+                    dn = data["deployed_name"] or "N/A"
+                    ev = data["env_version"] or "N/A"
+                    dv = data["deployed_version"] or "N/A"
+                    out.append(
+                        f"🔄 {en.upper()} → {dn.upper()}:\n"
+                        f"   Repository (.env): {ev}\n"
+                        f"   Deployed: {dv}\n"
+                    )
+
             if env_only:
-                print("📝 SERVICES ONLY IN .ENV:")
-                print()
+                out.append("📝 SERVICES ONLY IN .ENV:")
+                out.append("")
                 for service, data in env_only.items():
-                    print(f"   {data['env_name']}: {data['env_version']} (not deployed)")
-                print()
-            
+                    out.append(f"   {data['env_name']}: {data['env_version']} (not deployed)")
+                out.append("")
+
             if deployed_only:
-                print("🚀 SERVICES ONLY IN DEPLOYED:")
-                print()
+                out.append("🚀 SERVICES ONLY IN DEPLOYED:")
+                out.append("")
                 for service, data in deployed_only.items():
-                    print(f"   {data['deployed_name']}: {data['deployed_version']} (not in .env)")
-                print()
-                
+                    out.append(f"   {data['deployed_name']}: {data['deployed_version']} (not in .env)")
+                out.append("")
+
             # Show matching services in verbose mode
             if args.verbose and matches:
-                print("✅ MATCHING VERSIONS:")
-                print()
+                out.append("✅ MATCHING VERSIONS:")
+                out.append("")
                 for service, data in matches.items():
-                    env_name = data["env_name"]
-                    deployed_name = data["deployed_name"]
-                    version = data["env_version"]
-                    print(f"   {env_name} → {deployed_name}: {version}")
-                print()
+                    out.append(f"   {data['env_name']} → {data['deployed_name']}: {data['env_version']}")
+                out.append("")
         else:
-            print("✅ There is no difference in the deployed versions and latest version")
-        
-        print(f"{'='*60}")
+            out.append("✅ There is no difference in the deployed versions and latest version")
+
+        out.append(f"{'='*60}")
+        sys.stdout.write('\n'.join(out) + '\n')
         
     except ValueError as e:
         print(f"Configuration error: {e}", file=sys.stderr)
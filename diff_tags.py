@@ -1,8 +1,15 @@
 import os
-import requests
-from requests.auth import HTTPBasicAuth
 import sys
 
+import requests
+
+# One keepalive session for all pages of a comparison
+_SESSION = requests.Session()
+
+# GitHub caps compare pages at 250 commits
+_PER_PAGE = 250
+
+
 # Function to get commits between tags
 def get_commit_messages(repo_url, tag1, tag2, token):
     # Extract owner and repo from the URL
@@ -10,22 +17,47 @@ def get_commit_messages(repo_url, tag1, tag2, token):
         owner, repo = repo_url.rstrip('/').rsplit('/', 2)[-2:]
     except ValueError:
         print("The repository URL is not in the expected format.")
-        return
+        return []
 
-    # Construct API URL
-    api_url = f"https://github.com/appcd-dev/{repo}/compare/{tag1}...{tag2}"
-    headers = {'Authorization': f'token {token}'}
+    # REST compare endpoint — the previous code hit the HTML UI URL (with a
+    # hard-coded org), which returned HTML instead of JSON.
+    api_url = f"https://api.github.com/repos/{owner}/{repo}/compare/{tag1}...{tag2}"
+    _SESSION.headers.update({
+        'Authorization': f'token {token}',
+        'Accept': 'application/vnd.github.v3+json'
+    })
 
-    # Fetch commits
-    response = requests.get(api_url, headers=headers)
-    if response.status_code == 404:
-        print("Tags or repository not found.")
-    response.raise_for_status()
-    commits = response.json().get('commits', [])
+    # Fetch commits page by page so large deltas aren't truncated
+    messages = []
+    page = 1
+    while True:
+        response = _SESSION.get(
+            api_url, params={'per_page': _PER_PAGE, 'page': page}, timeout=30
+        )
+        if response.status_code == 404:
+            print("Tags or repository not found.")
+        response.raise_for_status()
+        data = response.json()
 
-    # Print commit messages
-    for commit in commits:
-        print(commit.get('commit', {}).get('message', 'No message'))
+        commits = data.get('commits', [])
+        messages.extend(
+            commit.get('commit', {}).get('message', 'No message')
+            for commit in commits
+        )
+
+        if not commits or page * _PER_PAGE >= data.get('total_commits', 0):
+            break
+        page += 1
+
+    return messages
+
+
+def run(repo_url, tag1, tag2):
+    """Fetch commit messages between two tags, for in-process callers."""
+    token = os.getenv('GITHUB_ACCESS_TOKEN')
+    if not token:
+        raise ValueError("Missing environment variable: GITHUB_ACCESS_TOKEN")
+    return get_commit_messages(repo_url, tag1, tag2, token)
 
 
 if __name__ == "__main__":
@@ -35,6 +67,5 @@ if __name__ == "__main__":
     elif len(sys.argv) != 4:
         print("Usage: python diff_tags.py <repo_url> <tag1> <tag2>")
     else:
-        repo_url = sys.argv[1]
-        # get_commit_messages(sys.argv[1], "v\.0\.56\.0", "v\.0\.58\.0", token) 
-        get_commit_messages(sys.argv[1], sys.argv[2], sys.argv[3], token) 
\ No newline at end of file
+        for message in get_commit_messages(sys.argv[1], sys.argv[2], sys.argv[3], token):
+            print(message)
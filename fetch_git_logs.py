@@ -1,8 +1,8 @@
-import subprocess
 import sys
-from pathlib import Path
 
-_REPO_ROOT = Path(__file__).resolve().parent
+import requests
+
+import diff_tags
 
 
 class GitLogFetcher:
@@ -13,19 +13,14 @@ class GitLogFetcher:
 
     def fetch_and_parse_logs(self):
         try:
-            diff_tags_script = _REPO_ROOT / "diff_tags.py"
-            result = subprocess.run(
-                [sys.executable, str(diff_tags_script), self.repo_url, self.tag1, self.tag2],
-                check=True, capture_output=True, text=True
-            )
-
-            # Parse commit messages
-            commit_messages = result.stdout.splitlines()
+            # Call diff_tags in-process — no interpreter startup or pipe
+            # serialization per tag pair.
+            commit_messages = diff_tags.run(self.repo_url, self.tag1, self.tag2)
             for message in commit_messages:
                 print(message)
 
-        except subprocess.CalledProcessError as e:
-            print(f"Error: {e.stderr}")
+        except (ValueError, requests.RequestException) as e:
+            print(f"Error: {e}")
 
 
 # Example usage:
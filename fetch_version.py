@@ -7,10 +7,28 @@ where env_name can be provided as a command-line argument or selected interactiv
 """
 
 import argparse
+import functools
 import sys
+import time
 import requests
 from enum import Enum
+from pathlib import Path
 from typing import Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Module-level session so sequential fetches reuse one keepalive TLS
+# connection instead of paying a fresh handshake per requests.get call.
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(max_retries=Retry(
+    total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504)
+)))
+
+# Short-TTL on-disk cache so repeated runs against the same environment
+# within a debugging session skip the network round trip entirely.
+_VERSION_CACHE_DIR = Path('~/.cache/release-utils/versions').expanduser()
+_VERSION_CACHE_TTL = 300  # seconds
 
 
 class Environment(Enum):
@@ -21,6 +39,7 @@ class Environment(Enum):
     DEMO = "demo.cloud"
     
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def get_display_names(cls) -> list[tuple[str, str]]:
         """Get a list of (display_name, value) tuples for menu display."""
         return [
@@ -31,6 +50,12 @@ class Environment(Enum):
         ]
 
 
+# Frozen set of valid environment values, built once at import so CLI
+# validation is an O(1) membership test instead of a per-run list rebuild.
+_VALID_ENV_VALUES = frozenset(e.value for e in Environment)
+Environment.VALID = _VALID_ENV_VALUES
+
+
 def select_environment_interactively() -> str:
     """
     Display a menu for environment selection and return the selected environment.
@@ -71,24 +96,46 @@ def select_environment_interactively() -> str:
             sys.exit(0)
 
 
-def fetch_version_content(env_name: str) -> Optional[str]:
+def fetch_version_content(env_name: str, use_cache: bool = True) -> Optional[str]:
     """
     Fetch content from the version.json endpoint for the given environment.
-    
+
     Args:
         env_name: The environment name to use in the URL
-        
+        use_cache: Serve a recent cached response when one exists
+
     Returns:
         The response content as string, or None if request failed
     """
+    cache_path = _VERSION_CACHE_DIR / f"{env_name}.json"
+
+    if use_cache:
+        try:
+            if time.time() - cache_path.stat().st_mtime < _VERSION_CACHE_TTL:
+                print(f"Using cached version.json for {env_name}")
+                return cache_path.read_text()
+        except OSError:
+            pass
+
     url = f"https://{env_name}.stackgen.com/version.json"
-    
+
     try:
         print(f"Fetching content from: {url}")
-        response = requests.get(url, timeout=30)
+        response = _SESSION.get(url, timeout=30)
         response.raise_for_status()  # Raises an HTTPError for bad responses
-        
-        return response.text
+
+        # version.json is always UTF-8; setting the encoding explicitly stops
+        # requests from running charset detection over the body.
+        response.encoding = 'utf-8'
+        content = response.text
+
+        try:
+            _VERSION_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(content)
+        except OSError:
+            pass
+
+        return content
         
     except requests.exceptions.RequestException as e:
         print(f"Error fetching content from {url}: {e}", file=sys.stderr)
@@ -115,9 +162,14 @@ def main():
         action="store_true",
         help="Enable verbose output"
     )
-    
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Skip the local version.json cache and fetch fresh content"
+    )
+
     args = parser.parse_args()
-    
+
     # Determine environment name
     if args.interactive or args.env_name is None:
         # Use interactive selection
@@ -127,10 +179,9 @@ def main():
         env_name = args.env_name
         
         # Validate against known environments if provided
-        valid_envs = [env.value for env in Environment]
-        if env_name not in valid_envs:
+        if env_name not in Environment.VALID:
             print(f"Warning: '{env_name}' is not in the predefined environment list.")
-            print(f"Valid environments: {', '.join(valid_envs)}")
+            print(f"Valid environments: {', '.join(e.value for e in Environment)}")
             confirm = input("Continue anyway? (y/N): ").strip().lower()
             if confirm not in ['y', 'yes']:
                 print("Operation cancelled.")
@@ -139,7 +190,7 @@ def main():
     if args.verbose:
         print(f"Environment: {env_name}")
     
-    content = fetch_version_content(env_name)
+    content = fetch_version_content(env_name, use_cache=not args.no_cache)
     
     if content is not None:
         print("\n" + "="*50)
@@ -14,53 +14,70 @@ Usage:
 import argparse
 import json
 import sys
-import urllib.request
-import urllib.error
-import ssl
 from typing import Optional
 
+import urllib3
 
-def fetch_url_content(url: str, timeout: int = 30) -> tuple[bool, str, Optional[dict]]:
+try:
+    # orjson (Rust) decodes JSON 2-5x faster than the stdlib and takes the
+    # raw bytes directly; fall back silently when it isn't installed.
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# One pooled HTTP client for the whole module: repeat fetches reuse the
+# TLS connection instead of re-handshaking per call. Certificate checks
+# stay disabled to match the previous unverified-SSL behavior.
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+_http = urllib3.PoolManager(
+    cert_reqs='CERT_NONE',
+    retries=urllib3.Retry(3, backoff_factor=0.2),
+)
+
+_USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+)
+
+
+def fetch_url_content(url: str, timeout: int = 30) -> tuple[bool, bytes | str, Optional[dict]]:
     """
     Fetch content from a URL.
-    
+
+    The body is returned as raw bytes and parsed as JSON without an
+    up-front decode — json.loads handles UTF-8 bytes natively, so the
+    common JSON path skips one full string copy of the payload. Callers
+    decode the bytes only when they need the text. On failure the second
+    element is an error message string instead.
+
     Args:
         url: URL to fetch content from
         timeout: Request timeout in seconds
-        
+
     Returns:
-        Tuple of (success, content, parsed_json)
+        Tuple of (success, raw_bytes_or_error, parsed_json)
     """
     try:
-        # Create request with proper headers
-        request = urllib.request.Request(
-            url,
-            headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
+        response = _http.request(
+            'GET', url,
+            timeout=timeout,
+            headers={'User-Agent': _USER_AGENT}
         )
-        
-        # Create SSL context that doesn't verify certificates
-        ssl_context = ssl.create_default_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
-        
-        # Fetch the content
-        with urllib.request.urlopen(request, timeout=timeout, context=ssl_context) as response:
-            content = response.read().decode('utf-8')
-            
-            # Try to parse as JSON
-            try:
-                parsed_json = json.loads(content)
-                return True, content, parsed_json
-            except json.JSONDecodeError:
-                # Not valid JSON, return as plain text
-                return True, content, None
-                
-    except urllib.error.HTTPError as e:
-        return False, f"HTTP Error {e.code}: {e.reason}", None
-    except urllib.error.URLError as e:
-        return False, f"URL Error: {e.reason}", None
+
+        if response.status >= 400:
+            return False, f"HTTP Error {response.status}: {response.reason}", None
+
+        raw = response.data
+
+        # Try to parse as JSON
+        try:
+            return True, raw, _json_loads(raw)
+        except ValueError:
+            # Not valid JSON, return as plain text
+            return True, raw, None
+
+    except urllib3.exceptions.HTTPError as e:
+        return False, f"URL Error: {e}", None
     except Exception as e:
         return False, f"Error: {str(e)}", None
 
@@ -137,21 +154,23 @@ Examples:
     print("-" * 60)
     
     # Fetch content
-    success, content, parsed_json = fetch_url_content(args.url, args.timeout)
-    
+    success, raw, parsed_json = fetch_url_content(args.url, args.timeout)
+
     if not success:
-        print(f"❌ Failed to fetch content: {content}", file=sys.stderr)
+        print(f"❌ Failed to fetch content: {raw}", file=sys.stderr)
         sys.exit(1)
-    
-    # Display content
+
+    # Decode the body only on the paths that actually print it as text
     if args.raw:
-        print_content(content, None, args.pretty)
+        print_content(raw.decode('utf-8', errors='replace'), None, args.pretty)
+    elif parsed_json is not None:
+        print_content('', parsed_json, args.pretty)
     else:
-        print_content(content, parsed_json, args.pretty)
-    
+        print_content(raw.decode('utf-8', errors='replace'), None, args.pretty)
+
     # Additional info
     print("\n" + "-" * 60)
-    print(f"Content length: {len(content)} characters")
+    print(f"Content length: {len(raw)} bytes")
     if parsed_json is not None:
         print(f"Content type: JSON")
         print(f"JSON keys: {list(parsed_json.keys()) if isinstance(parsed_json, dict) else 'Not a dictionary'}")
@@ -13,23 +13,98 @@ Usage:
 """
 
 import argparse
+import hashlib
 import json
 import os
 import re
-import subprocess
 import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 from urllib.parse import urlparse
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # orjson encodes/decodes the multi-MB report JSON several times faster
+    # than the stdlib and writes bytes in one shot; optional.
+    import orjson
+except ImportError:
+    orjson = None
+
+# Match ticket IDs: [PROJ-123] or PROJ-123 at word boundary (e.g.
+# "PLAT-1794 |", "OPS-219:"). Compiled once at import and shared by all
+# processor instances.
+_TICKET_RE = re.compile(
+    r'\[([A-Z]{2,6}-\d{1,6})\]'
+    r'|(?:^|[\s(])([A-Z]{2,6}-\d{1,6})(?=[\s:|\)\]\-,]|$)',
+    re.MULTILINE
+)
+
+try:
+    # aiohttp runs all Linear fetches on one event loop with a bounded
+    # semaphore; without it the code falls back to a thread pool.
+    import asyncio
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+@dataclass(slots=True)
+class Service:
+    """One input.json entry with its fields resolved once up front.
+
+    The processing paths touch these fields many times per service;
+    slotted attribute access replaces the repeated dict.get() hashing,
+    and the output records still serialize through result().
+    """
+    name: str
+    repository: str
+    current_tag: str
+    new_tag: str
+    version_key: str
+    repo_path: str = ''
+
+    @classmethod
+    def from_dict(cls, raw: Dict) -> 'Service':
+        return cls(
+            name=raw.get('service', 'unknown'),
+            repository=raw.get('repository', ''),
+            current_tag=raw.get('current_tag', ''),
+            new_tag=raw.get('new_tag', ''),
+            version_key=raw.get('version_key', ''),
+        )
+
+    def result(self, status: str, tickets: List[str],
+               error: Optional[str] = None) -> Dict:
+        """Serialize this service plus an outcome into an output record."""
+        return {
+            'service': self.name,
+            'repository': self.repository,
+            'repo_path': self.repo_path,
+            'version_key': self.version_key,
+            'current_tag': self.current_tag,
+            'new_tag': self.new_tag,
+            'status': status,
+            'tickets': tickets,
+            'ticket_count': len(tickets),
+            'error': error,
+        }
 
 
 class RepositoryProcessor:
     """Process multiple repositories and extract Linear tickets from version changes."""
     
     def __init__(self, skip_unchanged: bool = True, verbose: bool = False,
-                 fetch_linear_details: bool = True, commit_diff_log_path: Optional[str] = None):
+                 fetch_linear_details: bool = True, commit_diff_log_path: Optional[str] = None,
+                 use_compare_cache: bool = True):
         """
         Initialize the processor.
 
@@ -38,19 +113,54 @@ class RepositoryProcessor:
             verbose: Enable verbose output
             fetch_linear_details: Whether to fetch ticket details from Linear API
             commit_diff_log_path: If set, write full commit diff with messages to this file
+            use_compare_cache: Reuse ticket sets cached per (repo, from, to) triple
         """
         self.skip_unchanged = skip_unchanged
         self.verbose = verbose
         self.fetch_linear_details = fetch_linear_details
         self.commit_diff_log_path = commit_diff_log_path
-        # Match ticket IDs: [PROJ-123] or PROJ-123 at word boundary (e.g. "PLAT-1794 |", "OPS-219:")
-        self.ticket_pattern = re.compile(
-            r'\[([A-Z]{2,6}-\d{1,6})\]'
-            r'|(?:^|[\s(])([A-Z]{2,6}-\d{1,6})(?=[\s:|\)\]\-,]|$)',
-            re.MULTILINE
-        )
+        self.ticket_pattern = _TICKET_RE
         self.linear_api_key = os.getenv('LINEAR_API_KEY')
         self.linear_api_url = "https://api.linear.app/graphql"
+        # One pooled session for every Linear call: connections (and their
+        # TLS handshakes) are reused across requests and threads, with
+        # retries on transient statuses.
+        self._session = requests.Session()
+        self._session.headers.update({
+            "Authorization": self.linear_api_key or "",
+            "Content-Type": "application/json"
+        })
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 502, 503, 504),
+            ),
+        ))
+        # Workers append to the shared commit diff log concurrently; one
+        # lock keeps each repo's block contiguous.
+        self._diff_log_lock = threading.Lock()
+        # Shared GitHubTagComparator, created lazily on first use so runs
+        # that skip every service never import or authenticate it.
+        self._comparator = None
+        self._comparator_lock = threading.Lock()
+        # Ticket metadata changes rarely between release-diff runs, so
+        # details persist in a JSON cache across runs with a 24h TTL;
+        # reruns over overlapping ticket sets skip the API entirely.
+        self._ticket_cache_path = Path('~/.cache/release-utils/linear_tickets.json').expanduser()
+        self._ticket_cache_ttl = 24 * 3600
+        # Tags are immutable references in practice, so the ticket set for
+        # a (repo, from, to) triple is cached with no TTL; rerunning the
+        # same release diff skips the comparison entirely (--no-cache to
+        # force a refresh).
+        self.use_compare_cache = use_compare_cache
+        self._compare_cache_dir = Path('~/.cache/release-utils/compare_tags').expanduser()
+    
+    def close(self) -> None:
+        """Release the pooled HTTP connections."""
+        self._session.close()
     
     def extract_repo_path(self, repo_url: str) -> Optional[str]:
         """
@@ -75,9 +185,52 @@ class RepositoryProcessor:
             print(f"Error parsing repository URL '{repo_url}': {e}", file=sys.stderr)
             return None
     
+    def _compare_cache_file(self, repo: str, from_tag: str, to_tag: str) -> Path:
+        key = hashlib.blake2b(
+            f"{repo}|{from_tag}|{to_tag}".encode(), digest_size=16
+        ).hexdigest()
+        return self._compare_cache_dir / f"{key}.json"
+    
+    def _load_cached_tickets(self, repo: str, from_tag: str, to_tag: str) -> Optional[List[str]]:
+        """Return the cached ticket list for a comparison, or None."""
+        if not self.use_compare_cache:
+            return None
+        try:
+            with open(self._compare_cache_file(repo, from_tag, to_tag), encoding='utf-8') as f:
+                return json.load(f)['tickets']
+        except (OSError, ValueError, KeyError):
+            return None
+    
+    def _store_cached_tickets(self, repo: str, from_tag: str, to_tag: str, tickets: List[str]) -> None:
+        """Persist a comparison's ticket list for future runs."""
+        if not self.use_compare_cache:
+            return
+        try:
+            self._compare_cache_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                'w', dir=self._compare_cache_dir, delete=False,
+                suffix='.tmp', encoding='utf-8'
+            ) as tmp:
+                json.dump({'tickets': tickets}, tmp)
+            os.replace(tmp.name, self._compare_cache_file(repo, from_tag, to_tag))
+        except OSError:
+            pass
+    
+    def _tag_comparator(self):
+        """Build (once) the shared in-process GitHubTagComparator."""
+        with self._comparator_lock:
+            if self._comparator is None:
+                from compare_tags import GitHubTagComparator
+                self._comparator = GitHubTagComparator()
+            return self._comparator
+    
     def call_compare_tags(self, repo: str, from_tag: str, to_tag: str) -> str:
         """
-        Call compare_tags.py directly and return its output.
+        Compare two tags in-process and return the comparison as text.
+        
+        compare_tags is imported and called directly instead of spawning
+        a fresh interpreter per repo, so its HTTP session, token pool and
+        caches are shared across all services.
         
         Args:
             repo: Repository in format 'owner/repo'
@@ -85,41 +238,37 @@ class RepositoryProcessor:
             to_tag: Ending tag
             
         Returns:
-            Output from compare_tags.py as string
+            Commit messages between the tags as text, one block per commit
         """
-        cmd = [
-            sys.executable,
-            'compare_tags.py',
-            repo,
-            from_tag,
-            to_tag
-        ]
+        try:
+            comparator = self._tag_comparator()
+        except ValueError as e:
+            print(f"  ⚠️  Warning: {e}", file=sys.stderr)
+            return ""
         
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                cwd=Path(__file__).parent,
-                timeout=120  # 2 minute timeout
+            results = comparator.compare_tags(
+                repo, from_tag, to_tag,
+                show_commits=True, show_files=False, show_details=False
             )
-            
-            if result.returncode != 0:
-                if self.verbose:
-                    print(f"  ⚠️  Warning: compare_tags.py returned error: {result.stderr}", file=sys.stderr)
-                return ""
-            
-            return result.stdout
-            
-        except subprocess.TimeoutExpired:
-            print(f"  ⚠️  Warning: Timeout fetching changes for {repo}", file=sys.stderr)
-            return ""
-        except FileNotFoundError:
-            print("Error: compare_tags.py not found", file=sys.stderr)
-            return ""
         except Exception as e:
-            print(f"  ⚠️  Warning: Error calling compare_tags.py for {repo}: {e}", file=sys.stderr)
+            print(f"  ⚠️  Warning: Error comparing tags for {repo}: {e}", file=sys.stderr)
             return ""
+        
+        if 'error' in results:
+            if self.verbose:
+                print(f"  ⚠️  Warning: compare_tags returned error: {results['error']}", file=sys.stderr)
+            return ""
+        
+        lines = [
+            f"Comparison: {repo} {from_tag} → {to_tag} "
+            f"({results.get('total_commits', 0)} commits, status: {results.get('status', 'unknown')})"
+        ]
+        for commit in results.get('commits', []):
+            sha = commit.get('sha', '')[:7]
+            message = commit.get('commit', {}).get('message', 'No message')
+            lines.append(f"{sha} {message}")
+        return '\n'.join(lines) + '\n'
     
     def extract_tickets_from_text(self, text: str) -> Set[str]:
         """
@@ -131,14 +280,20 @@ class RepositoryProcessor:
         Returns:
             Set of unique Linear tickets found
         """
-        tickets = set()
-        matches = self.ticket_pattern.findall(text)
-        for match in matches:
-            # match is a tuple when pattern has multiple groups: (bracketed, unbracketed)
-            for g in (match if isinstance(match, tuple) else (match,)):
-                if g:
-                    tickets.add(g)
-        return tickets
+        # Every ticket ID contains a hyphen, so a substring scan (C-speed
+        # memchr) rejects ticket-free comparisons without ever entering
+        # the regex engine.
+        if '-' not in text:
+            return set()
+        # finditer streams matches straight into the set; findall would
+        # materialize an intermediate list of (bracketed, unbracketed)
+        # tuples first.
+        return {
+            g
+            for m in self.ticket_pattern.finditer(text)
+            for g in m.groups()
+            if g
+        }
     
     def fetch_ticket_details(self, ticket_id: str) -> Optional[Dict[str, str]]:
         """
@@ -174,20 +329,14 @@ class RepositoryProcessor:
         }
         """
         
-        headers = {
-            "Authorization": self.linear_api_key,
-            "Content-Type": "application/json"
-        }
-        
         payload = {
             "query": query,
             "variables": {"identifier": ticket_id}
         }
         
         try:
-            response = requests.post(
+            response = self._session.post(
                 self.linear_api_url,
-                headers=headers,
                 json=payload,
                 timeout=10
             )
@@ -199,27 +348,211 @@ class RepositoryProcessor:
                     return None
                 
                 if 'data' in data and data['data'].get('issue'):
-                    issue = data['data']['issue']
-                    return {
-                        'id': issue['identifier'],
-                        'title': issue['title'],
-                        'state': issue['state']['name'] if issue.get('state') else 'Unknown',
-                        'priority': issue.get('priority', 0),
-                        'assignee': issue['assignee']['name'] if issue.get('assignee') else 'Unassigned',
-                        'projectId': issue['project']['id'] if issue.get('project') else 'No Project',
-                        'projectName': issue['project']['name'] if issue.get('project') else 'No Project'
-                    }
+                    return self._issue_to_details(data['data']['issue'])
             
             return None
         except Exception:
             return None
     
-    def fetch_all_ticket_details(self, tickets: Set[str]) -> Dict[str, Optional[Dict[str, str]]]:
+    # Selection set shared by the single and batched queries, and the cap
+    # on aliases per batched document (stays under Linear's complexity
+    # limits).
+    _ISSUE_FIELDS = (
+        "identifier title state { name } priority "
+        "assignee { name } project { id name }"
+    )
+    _BATCH_SIZE = 25
+    
+    @classmethod
+    def _build_batch_query(cls, ticket_ids: List[str]) -> str:
+        """Build one aliased GraphQL document resolving a whole batch."""
+        selections = "\n".join(
+            f't{idx}: issue(id: "{ticket_id}") {{ {cls._ISSUE_FIELDS} }}'
+            for idx, ticket_id in enumerate(ticket_ids)
+        )
+        return f"query {{\n{selections}\n}}"
+    
+    def _parse_batch_data(self, data: Dict, ticket_ids: List[str]) -> Optional[Dict]:
+        """Map a batched response back to per-ticket details.
+
+        Returns None when the whole document failed, so the caller can fall
+        back to per-ticket fetches.
+        """
+        if 'errors' in data and 'data' not in data:
+            return None
+        payload = data.get('data') or {}
+        details = {}
+        for idx, ticket_id in enumerate(ticket_ids):
+            issue = payload.get(f't{idx}')
+            details[ticket_id] = self._issue_to_details(issue) if issue else None
+        return details
+    
+    def fetch_ticket_details_batch(self, ticket_ids: List[str]) -> Optional[Dict[str, Optional[Dict[str, str]]]]:
+        """
+        Fetch details for a batch of tickets in one request.
+        
+        Args:
+            ticket_ids: Ticket IDs for one batch (at most _BATCH_SIZE)
+            
+        Returns:
+            Dictionary mapping each ID to its details (or None per miss),
+            or None if the whole request failed
+        """
+        try:
+            response = self._session.post(
+                self.linear_api_url,
+                json={"query": self._build_batch_query(ticket_ids)},
+                timeout=10
+            )
+            if response.status_code != 200:
+                return None
+            return self._parse_batch_data(response.json(), ticket_ids)
+        except Exception:
+            return None
+    
+    def _load_ticket_cache(self) -> Dict:
+        """Load the on-disk ticket cache; empty dict when absent/corrupt."""
+        try:
+            with open(self._ticket_cache_path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_ticket_cache(self, cache: Dict) -> None:
+        """Write the ticket cache atomically (temp file + rename)."""
+        try:
+            self._ticket_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                'w', dir=self._ticket_cache_path.parent, delete=False,
+                suffix='.tmp', encoding='utf-8'
+            ) as tmp:
+                json.dump(cache, tmp)
+            os.replace(tmp.name, self._ticket_cache_path)
+        except OSError:
+            pass
+    
+    @staticmethod
+    def _issue_to_details(issue: Dict) -> Dict[str, str]:
+        """Map a Linear issue node to the flat details dict used in output."""
+        return {
+            'id': issue['identifier'],
+            'title': issue['title'],
+            'state': issue['state']['name'] if issue.get('state') else 'Unknown',
+            'priority': issue.get('priority', 0),
+            'assignee': issue['assignee']['name'] if issue.get('assignee') else 'Unassigned',
+            'projectId': issue['project']['id'] if issue.get('project') else 'No Project',
+            'projectName': issue['project']['name'] if issue.get('project') else 'No Project'
+        }
+    
+    async def _afetch_ticket(self, session, semaphore, ticket_id: str):
+        """Fetch one ticket's details on the shared aiohttp session."""
+        payload = {
+            "query": """
+        query IssueByIdentifier($identifier: String!) {
+            issue(id: $identifier) {
+                id
+                identifier
+                title
+                state {
+                    name
+                }
+                priority
+                assignee {
+                    name
+                }
+                project {
+                    id
+                    name
+                }
+            }
+        }
+        """,
+            "variables": {"identifier": ticket_id}
+        }
+        async with semaphore:
+            try:
+                async with session.post(self.linear_api_url, json=payload) as response:
+                    if response.status != 200:
+                        return ticket_id, None
+                    data = await response.json()
+            except Exception:
+                return ticket_id, None
+        if 'errors' in data:
+            return ticket_id, None
+        if 'data' in data and data['data'].get('issue'):
+            return ticket_id, self._issue_to_details(data['data']['issue'])
+        return ticket_id, None
+    
+    async def _afetch_chunk(self, session, semaphore, chunk: List[str]) -> Dict[str, Optional[Dict[str, str]]]:
+        """Fetch one batch; fall back to per-ticket fetches on failure."""
+        async with semaphore:
+            try:
+                async with session.post(
+                    self.linear_api_url,
+                    json={"query": self._build_batch_query(chunk)},
+                ) as response:
+                    data = await response.json() if response.status == 200 else None
+            except Exception:
+                data = None
+        details = self._parse_batch_data(data, chunk) if data is not None else None
+        if details is not None:
+            return details
+        pairs = await asyncio.gather(
+            *[self._afetch_ticket(session, semaphore, t) for t in chunk]
+        )
+        return dict(pairs)
+    
+    async def _afetch_all_tickets(self, chunks: List[List[str]]) -> Dict[str, Optional[Dict[str, str]]]:
+        """Fetch all batches concurrently over one pooled connection."""
+        semaphore = asyncio.Semaphore(20)
+        async with aiohttp.ClientSession(
+            headers={
+                "Authorization": self.linear_api_key,
+                "Content-Type": "application/json"
+            },
+            timeout=aiohttp.ClientTimeout(total=10),
+            connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300),
+        ) as session:
+            per_chunk = await asyncio.gather(
+                *[self._afetch_chunk(session, semaphore, chunk) for chunk in chunks]
+            )
+        details = {}
+        for chunk_details in per_chunk:
+            details.update(chunk_details)
+        return details
+    
+    def _prefetch_ticket_details(self, ticket_ids: List[str]) -> Dict[str, Optional[Dict[str, str]]]:
+        """
+        Fetch details for tickets not already fresh in the disk cache.
+
+        Runs on a background worker while tag comparisons are still in
+        flight, so the Linear phase overlaps the GitHub phase. Results are
+        returned (not persisted); fetch_all_ticket_details merges and
+        persists them at the end.
+        """
+        cache = self._load_ticket_cache()
+        cutoff = time.time() - self._ticket_cache_ttl
+        misses = [
+            t for t in ticket_ids
+            if not (cache.get(t) and cache[t].get('fetched_at', 0) > cutoff)
+        ]
+        details = {}
+        for i in range(0, len(misses), self._BATCH_SIZE):
+            chunk = misses[i:i + self._BATCH_SIZE]
+            chunk_details = self.fetch_ticket_details_batch(chunk)
+            if chunk_details is None:
+                chunk_details = {t: self.fetch_ticket_details(t) for t in chunk}
+            details.update(chunk_details)
+        return details
+    
+    def fetch_all_ticket_details(self, tickets: Set[str],
+                                 prefetched: Optional[Dict[str, Optional[Dict[str, str]]]] = None) -> Dict[str, Optional[Dict[str, str]]]:
         """
         Fetch details for all tickets from Linear API.
         
         Args:
             tickets: Set of ticket IDs
+            prefetched: Details already fetched by _prefetch_ticket_details
             
         Returns:
             Dictionary mapping ticket IDs to their details
@@ -227,18 +560,81 @@ class RepositoryProcessor:
         if not self.fetch_linear_details or not self.linear_api_key:
             return {ticket: None for ticket in tickets}
         
+        prefetched = prefetched or {}
         ticket_details = {}
         total = len(tickets)
         
         if self.verbose and total > 0:
             print(f"\n📋 Fetching Linear ticket details for {total} unique tickets...")
         
-        for idx, ticket in enumerate(sorted(tickets), 1):
-            if self.verbose and total > 0:
-                print(f"  [{idx}/{total}] Fetching {ticket}...", end='\r')
+        # Serve prefetched answers and anything still fresh on disk first
+        cache = self._load_ticket_cache()
+        cutoff = time.time() - self._ticket_cache_ttl
+        misses = []
+        fetched_early = []
+        for ticket in sorted(tickets):
+            details = prefetched.get(ticket)
+            if details is not None:
+                ticket_details[ticket] = details
+                fetched_early.append(ticket)
+                continue
+            entry = cache.get(ticket)
+            if entry and entry.get('fetched_at', 0) > cutoff:
+                ticket_details[ticket] = entry['details']
+            else:
+                misses.append(ticket)
+        
+        hits = total - len(misses) - len(fetched_early)
+        if self.verbose and total > 0 and (hits or fetched_early):
+            print(f"  💾 {hits}/{total} tickets served from cache, "
+                  f"{len(fetched_early)} prefetched during comparison")
+        
+        if not misses:
+            if fetched_early:
+                now = time.time()
+                for ticket in fetched_early:
+                    cache[ticket] = {'fetched_at': now, 'details': ticket_details[ticket]}
+                self._save_ticket_cache(cache)
+            return ticket_details
+        
+        # One aliased document resolves _BATCH_SIZE tickets per round trip
+        chunks = [
+            misses[i:i + self._BATCH_SIZE]
+            for i in range(0, len(misses), self._BATCH_SIZE)
+        ]
+        if aiohttp is not None:
+            # One event loop, one pooled session, batches in flight
+            # concurrently: N serial round trips become ~N/_BATCH_SIZE.
+            ticket_details.update(asyncio.run(self._afetch_all_tickets(chunks)))
+        else:
+            def fetch_chunk(chunk):
+                details = self.fetch_ticket_details_batch(chunk)
+                if details is None:
+                    # Whole batch failed — retry tickets individually
+                    details = {t: self.fetch_ticket_details(t) for t in chunk}
+                return details
             
-            details = self.fetch_ticket_details(ticket)
-            ticket_details[ticket] = details
+            with ThreadPoolExecutor(max_workers=min(20, len(chunks))) as pool:
+                futures = [pool.submit(fetch_chunk, chunk) for chunk in chunks]
+                # Debounced progress: a print with end='\r' flushes (one
+                # write syscall) per update, so emit at most ~4/s.
+                last_print = 0.0
+                for idx, future in enumerate(as_completed(futures), 1):
+                    if self.verbose and total > 0:
+                        now = time.monotonic()
+                        if idx == len(chunks) or now - last_print > 0.25:
+                            print(f"  [batch {idx}/{len(chunks)}] Fetching...", end='\r')
+                            last_print = now
+                    ticket_details.update(future.result())
+        
+        # Persist newly fetched details (misses with no answer stay
+        # uncached so the next run retries them)
+        now = time.time()
+        for ticket in misses + fetched_early:
+            details = ticket_details.get(ticket)
+            if details is not None:
+                cache[ticket] = {'fetched_at': now, 'details': details}
+        self._save_ticket_cache(cache)
         
         if self.verbose and total > 0:
             successful = sum(1 for d in ticket_details.values() if d is not None)
@@ -272,20 +668,14 @@ class RepositoryProcessor:
         }
         """
         
-        headers = {
-            "Authorization": self.linear_api_key,
-            "Content-Type": "application/json"
-        }
-        
         payload = {
             "query": query,
             "variables": {"id": project_id}
         }
         
         try:
-            response = requests.post(
+            response = self._session.post(
                 self.linear_api_url,
-                headers=headers,
                 json=payload,
                 timeout=10
             )
@@ -330,9 +720,14 @@ class RepositoryProcessor:
         if self.verbose and total > 0:
             print(f"\n🏗️  Fetching Linear project details for {total} unique projects...")
         
+        # Debounced progress (see fetch_all_ticket_details)
+        last_print = 0.0
         for idx, project_id in enumerate(sorted(project_ids), 1):
             if self.verbose and total > 0:
-                print(f"  [{idx}/{total}] Fetching project {project_id}...", end='\r')
+                now = time.monotonic()
+                if idx == total or now - last_print > 0.25:
+                    print(f"  [{idx}/{total}] Fetching project {project_id}...", end='\r')
+                    last_print = now
             
             details = self.fetch_project_details(project_id)
             project_details[project_id] = details
@@ -343,18 +738,18 @@ class RepositoryProcessor:
         
         return project_details
     
-    def should_process_service(self, service: Dict) -> bool:
+    def should_process_service(self, service: Service) -> bool:
         """
         Determine if a service should be processed.
         
         Args:
-            service: Service dictionary from input.json
+            service: Service record built from input.json
             
         Returns:
             True if service should be processed
         """
-        current = service.get('current_tag', '')
-        new = service.get('new_tag', '')
+        current = service.current_tag
+        new = service.new_tag
         
         # Skip if both tags are empty
         if not current and not new:
@@ -366,67 +761,60 @@ class RepositoryProcessor:
         
         return True
     
-    def process_service(self, service: Dict) -> Optional[Dict]:
+    def process_service(self, service: Service) -> Tuple[Optional[Dict], List[str]]:
         """
         Process a single service and extract ticket changes.
-        
+
+        Runs on a worker thread, so progress output is collected into a log
+        list instead of printed — the caller prints each service's block as
+        its future completes, keeping output unscrambled.
+
         Args:
-            service: Service dictionary from input.json
-            
+            service: Service record built from input.json
+
         Returns:
-            Dictionary with service info and tickets, or None if failed
+            Tuple of (result dictionary or None if failed, log lines)
         """
-        service_name = service.get('service', 'unknown')
-        repo_url = service.get('repository', '')
-        current_tag = service.get('current_tag', '')
-        new_tag = service.get('new_tag', '')
-        version_key = service.get('version_key', '')
-        
+        log = []
+        service_name = service.name
+        current_tag = service.current_tag
+        new_tag = service.new_tag
+
         # Extract repo path
-        repo_path = self.extract_repo_path(repo_url)
+        repo_path = self.extract_repo_path(service.repository)
         if not repo_path:
-            print(f"  ❌ Invalid repository URL for {service_name}", file=sys.stderr)
-            return None
-        
-        print(f"  📦 Processing {service_name} ({current_tag} → {new_tag})...")
-        print(f"     Comparing 2 tags for repository: {repo_path} (service: {service_name})")
-        print(f"     From tag: {current_tag}  →  To tag: {new_tag}")
-        print(f"     Fetching commit messages between these tags...")
-        
+            log.append(f"  ❌ Invalid repository URL for {service_name}")
+            return None, log
+        service.repo_path = repo_path
+
+        log.append(f"  📦 Processing {service_name} ({current_tag} → {new_tag})...")
+        log.append(f"     Comparing 2 tags for repository: {repo_path} (service: {service_name})")
+        log.append(f"     From tag: {current_tag}  →  To tag: {new_tag}")
+        log.append(f"     Fetching commit messages between these tags...")
+
         # Handle empty current_tag - might be a new service
         if not current_tag and new_tag:
-            print(f"     ℹ️  New service detected, skipping (no previous version to compare)")
-            return {
-                'service': service_name,
-                'repository': repo_url,
-                'repo_path': repo_path,
-                'version_key': version_key,
-                'current_tag': current_tag,
-                'new_tag': new_tag,
-                'status': 'new_service',
-                'tickets': [],
-                'ticket_count': 0,
-                'error': None
-            }
-        
+            log.append(f"     ℹ️  New service detected, skipping (no previous version to compare)")
+            return service.result('new_service', []), log
+
         # Handle empty new_tag
         if not new_tag:
-            print(f"     ℹ️  No new version specified, skipping")
-            return {
-                'service': service_name,
-                'repository': repo_url,
-                'repo_path': repo_path,
-                'version_key': version_key,
-                'current_tag': current_tag,
-                'new_tag': new_tag,
-                'status': 'no_new_version',
-                'tickets': [],
-                'ticket_count': 0,
-                'error': None
-            }
+            log.append(f"     ℹ️  No new version specified, skipping")
+            return service.result('no_new_version', []), log
         
+        # Repeated runs of the same release diff hit the on-disk cache and
+        # skip the comparison (and its GitHub traffic) entirely. The cache
+        # stores only ticket IDs, so when a commit diff log was requested
+        # the comparison must run anyway to have output to append.
+        if not self.commit_diff_log_path:
+            cached_tickets = self._load_cached_tickets(repo_path, current_tag, new_tag)
+            if cached_tickets is not None:
+                log.append(f"     💾 {len(cached_tickets)} tickets served from comparison cache")
+                return service.result('success', cached_tickets), log
+
         # --- Log git commit changes: fetch comparison and optionally write to file ---
-        # Call compare_tags.py to get full diff between current_tag and new_tag (summary, commit list, full messages, file changes)
+        # Compare the tags in-process: summary plus the commit list with
+        # full messages (show_files=False, so no file changes)
         output = self.call_compare_tags(repo_path, current_tag, new_tag)
         
         if output:
@@ -439,7 +827,8 @@ class RepositoryProcessor:
             if self.commit_diff_log_path:
                 try:
                     Path(self.commit_diff_log_path).parent.mkdir(parents=True, exist_ok=True)
-                    with open(self.commit_diff_log_path, "a", encoding="utf-8") as f:
+                    with self._diff_log_lock, \
+                            open(self.commit_diff_log_path, "a", encoding="utf-8") as f:
                         f.write(f"\n{'='*80}\n")
                         f.write(f"Repository: {repo_path} | Service: {service_name}\n")
                         f.write(f"Tags: {current_tag} → {new_tag}\n")
@@ -448,42 +837,23 @@ class RepositoryProcessor:
                         f.write(f"\n{'='*80}\n\n")
                 except OSError as e:
                     if self.verbose:
-                        print(f"  ⚠️  Could not write commit diff log: {e}", file=sys.stderr)
+                        log.append(f"  ⚠️  Could not write commit diff log: {e}")
         if not output:
-            return {
-                'service': service_name,
-                'repository': repo_url,
-                'repo_path': repo_path,
-                'version_key': version_key,
-                'current_tag': current_tag,
-                'new_tag': new_tag,
-                'status': 'error',
-                'tickets': [],
-                'ticket_count': 0,
-                'error': 'Failed to fetch commits or no commits found'
-            }
+            return service.result(
+                'error', [], error='Failed to fetch commits or no commits found'
+            ), log
         
         # Extract tickets
         tickets = self.extract_tickets_from_text(output)
         sorted_tickets = sorted(tickets)
+        self._store_cached_tickets(repo_path, current_tag, new_tag, sorted_tickets)
         
         if tickets:
-            print(f"     ✅ Found {len(tickets)} tickets")
+            log.append(f"     ✅ Found {len(tickets)} tickets")
         else:
-            print(f"     ℹ️  No tickets found")
-        
-        return {
-            'service': service_name,
-            'repository': repo_url,
-            'repo_path': repo_path,
-            'version_key': version_key,
-            'current_tag': current_tag,
-            'new_tag': new_tag,
-            'status': 'success',
-            'tickets': sorted_tickets,
-            'ticket_count': len(tickets),
-            'error': None
-        }
+            log.append(f"     ℹ️  No tickets found")
+
+        return service.result('success', sorted_tickets), log
     
     def process_all_services(self, services: List[Dict]) -> Dict:
         """
@@ -512,6 +882,9 @@ class RepositoryProcessor:
             except OSError as e:
                 if self.verbose:
                     print(f"  ⚠️  Could not create commit diff log: {e}", file=sys.stderr)
+        # Resolve each raw dict into a slotted record once; everything
+        # downstream uses attribute access instead of repeated .get()
+        services = [Service.from_dict(s) for s in services]
         results = []
         total_services = len(services)
         processed = 0
@@ -519,24 +892,66 @@ class RepositoryProcessor:
         failed = 0
         total_tickets = set()
         
+        # Serial pre-check builds the work list; the per-service compare
+        # is HTTP wait, so the GIL is released and threads give
+        # max-of-latencies wall time instead of sum-of-latencies.
+        work = []
         for i, service in enumerate(services, 1):
-            print(f"\n[{i}/{total_services}] {service.get('service', 'unknown')}")
-            
             if not self.should_process_service(service):
+                print(f"\n[{i}/{total_services}] {service.name}")
                 print(f"  ⏭️  Skipping (no changes)")
                 skipped += 1
-                continue
-            
-            result = self.process_service(service)
-            if result:
-                results.append(result)
-                if result['status'] == 'success':
-                    processed += 1
-                    total_tickets.update(result['tickets'])
-                elif result['status'] == 'error':
-                    failed += 1
             else:
-                failed += 1
+                work.append((i, service))
+
+        # Pipeline the two I/O phases: as soon as a service's ticket set is
+        # known, its Linear lookups start on a side pool while other tag
+        # comparisons are still running.
+        prefetch = self.fetch_linear_details and self.linear_api_key
+        detail_pool = ThreadPoolExecutor(max_workers=4) if prefetch else None
+        detail_futures = []
+        
+        indexed_results = []
+        if work:
+            with ThreadPoolExecutor(max_workers=min(32, len(work))) as pool:
+                futures = {
+                    pool.submit(self.process_service, service): (i, service)
+                    for i, service in work
+                }
+                for future in as_completed(futures):
+                    i, service = futures[future]
+                    result, log = future.result()
+                    # Print each service's buffered block as it finishes so
+                    # concurrent workers don't interleave lines.
+                    print(f"\n[{i}/{total_services}] {service.name}")
+                    for line in log:
+                        print(line)
+                    if result:
+                        indexed_results.append((i, result))
+                        if result['status'] == 'success':
+                            processed += 1
+                            new_tickets = [
+                                t for t in result['tickets'] if t not in total_tickets
+                            ]
+                            total_tickets.update(new_tickets)
+                            if detail_pool is not None and new_tickets:
+                                detail_futures.append(detail_pool.submit(
+                                    self._prefetch_ticket_details, new_tickets
+                                ))
+                        elif result['status'] == 'error':
+                            failed += 1
+                    else:
+                        failed += 1
+        
+        prefetched = {}
+        if detail_pool is not None:
+            for future in detail_futures:
+                prefetched.update(future.result())
+            detail_pool.shutdown()
+
+        # Report in input order regardless of completion order
+        indexed_results.sort()
+        results.extend(result for _, result in indexed_results)
         
         # Generate summary
         print("\n" + "=" * 70)
@@ -548,28 +963,24 @@ class RepositoryProcessor:
         print(f"Failed: {failed}")
         print(f"Unique tickets across all services: {len(total_tickets)}")
         
-        # Group tickets by project
-        projects = {}
-        for ticket in total_tickets:
-            prefix = ticket.split('-')[0]
-            if prefix not in projects:
-                projects[prefix] = []
-            projects[prefix].append(ticket)
+        # total_tickets already holds every successful service's tickets,
+        # so one grouping pass serves both the printed counts and the
+        # tickets_by_project output — no rebuilding the set from results.
+        # Iterating in sorted order also leaves every bucket sorted by
+        # construction, so no per-prefix re-sort is needed.
+        all_tickets_set = total_tickets
+        tickets_by_project = defaultdict(list)
+        for ticket_id in sorted(all_tickets_set):
+            tickets_by_project[ticket_id.split('-', 1)[0]].append(ticket_id)
         
-        if projects:
+        if tickets_by_project:
             print(f"\nTickets by project:")
-            for prefix in sorted(projects.keys()):
-                print(f"  - {prefix}: {len(projects[prefix])} tickets")
+            for prefix in sorted(tickets_by_project):
+                print(f"  - {prefix}: {len(tickets_by_project[prefix])} tickets")
         
-        # Collect all unique tickets
-        all_tickets_set = set()
-        for result in results:
-            if result["status"] == "success":
-                for ticket in result["tickets"]:
-                    all_tickets_set.add(ticket)
-        
-        # Fetch Linear details for all unique tickets
-        ticket_details_map = self.fetch_all_ticket_details(all_tickets_set)
+        # Fetch Linear details for all unique tickets (most already in
+        # hand from the pipelined prefetch)
+        ticket_details_map = self.fetch_all_ticket_details(all_tickets_set, prefetched=prefetched)
         
         # Collect unique project IDs from ticket details
         project_ids = set()
@@ -605,17 +1016,6 @@ class RepositoryProcessor:
                 # If no details available, just include the ID
                 all_tickets.append(ticket_id)
         
-        # Group tickets by project (still using IDs for backward compatibility)
-        tickets_by_project = {}
-        for ticket_id in sorted(all_tickets_set):
-            prefix = ticket_id.split('-')[0]
-            if prefix not in tickets_by_project:
-                tickets_by_project[prefix] = []
-            tickets_by_project[prefix].append(ticket_id)
-        
-        for prefix in tickets_by_project:
-            tickets_by_project[prefix] = sorted(tickets_by_project[prefix])
-        
         # Generate projects list for output
         projects_list = []
         for project_id in sorted(project_ids):
@@ -643,11 +1043,24 @@ class RepositoryProcessor:
             },
             'services': results,
             'all_tickets': all_tickets,
-            'tickets_by_project': tickets_by_project,
+            'tickets_by_project': dict(tickets_by_project),
             'projects': projects_list
         }
 
 
+def _write_json(path, obj, pretty: bool = False) -> None:
+    """Serialize obj to path, with orjson when available."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0))
+    else:
+        with open(path, 'w') as f:
+            if pretty:
+                json.dump(obj, f, indent=2, ensure_ascii=False)
+            else:
+                json.dump(obj, f, ensure_ascii=False)
+
+
 def main():
     """Main function to handle command-line arguments and process repositories."""
     parser = argparse.ArgumentParser(
@@ -699,6 +1112,11 @@ Examples:
         action="store_true",
         help="Skip fetching ticket details from Linear API"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached comparison results and refetch everything"
+    )
     parser.add_argument(
         "--commit-diff-log",
         metavar="FILE",
@@ -713,14 +1131,15 @@ Examples:
     
     args = parser.parse_args()
     
-    # Read input file
+    # Read input file (raw bytes; both decoders accept UTF-8 bytes directly)
     try:
-        with open(args.input, 'r') as f:
-            services = json.load(f)
+        with open(args.input, 'rb') as f:
+            raw = f.read()
+        services = orjson.loads(raw) if orjson is not None else json.loads(raw)
     except FileNotFoundError:
         print(f"Error: Input file '{args.input}' not found", file=sys.stderr)
         sys.exit(1)
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         print(f"Error: Invalid JSON in '{args.input}': {e}", file=sys.stderr)
         sys.exit(1)
     
@@ -744,30 +1163,26 @@ Examples:
         skip_unchanged=not args.include_unchanged,
         verbose=args.verbose,
         fetch_linear_details=not args.no_fetch_details if hasattr(args, 'no_fetch_details') else True,
-        commit_diff_log_path=commit_diff_log_path
+        commit_diff_log_path=commit_diff_log_path,
+        use_compare_cache=not args.no_cache
     )
     
     # Process all services
-    results = processor.process_all_services(services)
+    try:
+        results = processor.process_all_services(services)
+    finally:
+        processor.close()
     
     # Write output
     try:
-        with open(output_file, 'w') as f:
-            if args.pretty:
-                json.dump(results, f, indent=2, ensure_ascii=False)
-            else:
-                json.dump(results, f, ensure_ascii=False)
+        _write_json(output_file, results, pretty=args.pretty)
         
         print(f"\n✅ Results saved to: {output_file}")
         
         # Generate separate projects_list.json file
         if 'projects' in results and results['projects']:
             projects_output_file = output_dir / "projects_list.json"
-            with open(projects_output_file, 'w') as f:
-                if args.pretty:
-                    json.dump(results['projects'], f, indent=2, ensure_ascii=False)
-                else:
-                    json.dump(results['projects'], f, ensure_ascii=False)
+            _write_json(projects_output_file, results['projects'], pretty=args.pretty)
             
             print(f"✅ Projects list saved to: {projects_output_file}")
             print(f"📊 Found {len(results['projects'])} unique projects")
